@@ -0,0 +1,21 @@
+"""
+Django settings used when running the test suite.
+
+Extends the default settings with overrides that make the tests faster.
+"""
+from app.settings import *  # noqa: F401, F403
+
+# Password hashing
+# PBKDF2 is deliberately slow, in tests the password only has to round-trip
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Database
+# Tests don't need a durable database, an in-memory SQLite database removes the disk I/O
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
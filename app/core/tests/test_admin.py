@@ -8,21 +8,24 @@ from django.test import Client
 class AdminSiteTests(TestCase):
     """ Tests for Django admin """
 
-    def setUp(self):
-        """ Create user and client """
-        self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        """ Create users once for all tests """
+        cls.admin_user = get_user_model().objects.create_superuser(
             email='admin@example.com',
             password='test1234',
             name='Test Admin'
         )
-        self.client.force_login(self.admin_user)
-
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             email='user@example.com',
             password='testpass1234'
         )
 
+    def setUp(self):
+        """ Create client logged in as admin """
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
     def test_users_list(self):
         """ Test that users are listet od page """
         url = reverse('admin:core_user_changelist')
@@ -1,112 +1,149 @@
 # """ Test for the remainders API """
 from datetime import date
 
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework import status
 
 from core.models import Remainder
-from ..serializers import RemainderSerializer
+from ..views import RemainderViewSet
 
 REMAINDERS_URL = reverse('remainders:remainders-list')
 
+TODAY = date.today()
+NEXT_YEAR = TODAY.replace(year=TODAY.year + 1)
+NEXT_JAN_1 = date(TODAY.year + 1, 1, 1)
+NEXT_FEB_27 = date(TODAY.year + 1, 2, 27)
+NEXT_FEB_28 = date(TODAY.year + 1, 2, 28)
+
 
 def detail_url(remainder_id):
     """ Create and return a URL for specific object """
-    return reverse('remainders:remainders-detail', args=[remainder_id])
+    # The router's detail route is the list route followed by the pk, no need to reverse it on every call
+    return f'{REMAINDERS_URL}{remainder_id}/'
 
 
 def date_to_string(date_type):
     return date_type.strftime('%Y-%m-%d')
 
 
-def create_remainder(user, **kwargs):
-    """ Create and return a test remainder """
-    today = date.today()
+def expected_remainders(remainders):
+    """ Return the API representation expected for a queryset of remainders """
+    expected = []
+    for remainder in remainders.values('id', 'title', 'description', 'remainder_date', 'permanent'):
+        remainder['remainder_date'] = date_to_string(remainder['remainder_date'])
+        expected.append(remainder)
+    return expected
+
+
+def remainder_defaults(**kwargs):
+    """ Return field values for a test remainder """
     defaults = {
         'title': 'Test Remainder',
         'description': 'Test description.',
-        'remainder_date': date(today.year + 1, today.month, today.day),
+        'remainder_date': NEXT_YEAR,
         'permanent': True
     }
     defaults.update(**kwargs)
-    remainder = Remainder.objects.create(user=user, **defaults)
+    return defaults
+
+
+def create_remainder(user, **kwargs):
+    """ Create and return a test remainder """
+    # bulk_create skips save() and the model signals, which aren't under test here
+    remainder = Remainder(user=user, **remainder_defaults(**kwargs))
+    Remainder.objects.bulk_create([remainder])
     return remainder
 
 
+def create_remainders(user, count, **kwargs):
+    """ Create and return multiple test remainders with a single query """
+    defaults = remainder_defaults(**kwargs)
+    remainders = [Remainder(user=user, **defaults) for _ in range(count)]
+    return Remainder.objects.bulk_create(remainders, batch_size=1000)
+
+
 def create_user(**params):
     """ Create and return a test user """
     user = get_user_model().objects.create_user(**params)
     return user
 
 
-class PublicRemaindersAPITests(TestCase):
+class PublicRemaindersAPITests(SimpleTestCase):
     """ Test unauthenticated API requests """
 
     def setUp(self):
-        self.client = APIClient()
+        # Calling the view directly skips the middleware and URL resolving, only auth is under test
+        self.factory = APIRequestFactory()
 
     def test_auth_required(self):
         """ Test authentication is required to call API """
-        res = self.client.get(REMAINDERS_URL)
+        request = self.factory.get(REMAINDERS_URL)
+        res = RemainderViewSet.as_view({'get': 'list'})(request)
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
 class PrivateRecipeAPITests(TestCase):
     """ Test authenticated API requests """
 
+    @classmethod
+    def setUpTestData(cls):
+        # Created once per class, every test is rolled back to this state
+        cls.user = create_user(email='test@example.com', password='Test1234')
+        cls.other_user = create_user(email='other_user@example.com', password='Password1234')
+
     def setUp(self):
-        self.today = date.today()
         self.client = APIClient()
-        self.user = create_user(email='test@example.com', password='Test1234')
         self.client.force_authenticate(self.user)
 
     def test_retrieve_remainders(self):
         """ Test retrieving a list of remainders works for authenticated users"""
-        create_remainder(user=self.user)
-        create_remainder(user=self.user)
-        create_remainder(user=self.user)
+        create_remainders(user=self.user, count=3)
 
-        res = self.client.get(REMAINDERS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(REMAINDERS_URL)
 
         remainders = Remainder.objects.all()
-        serializer = RemainderSerializer(remainders, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(len(res.data), 3)
+        self.assertEqual(res.data, expected_remainders(remainders))
 
     def test_remainders_limited_to_a_user(self):
         """ Test retrieved remainders are limited to the authenticated user """
-        other_user = create_user(email='other_user@example.com', password='Password1234')
-        create_remainder(user=other_user)
-        create_remainder(user=self.user)
+        Remainder.objects.bulk_create([
+            Remainder(user=self.other_user, **remainder_defaults()),
+            Remainder(user=self.user, **remainder_defaults()),
+        ])
 
-        res = self.client.get(REMAINDERS_URL)
+        with self.assertNumQueries(1):
+            res = self.client.get(REMAINDERS_URL)
 
         remainders = Remainder.objects.filter(user_id=self.user.id)
-        serializer = RemainderSerializer(remainders, many=True)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data, expected_remainders(remainders))
 
     def test_get_specific_remainder(self):
         """ Test retrieving a specific remainder works """
         remainder = create_remainder(user=self.user)
-        res = self.client.get(detail_url(remainder.id))
+        with self.assertNumQueries(1):
+            res = self.client.get(detail_url(remainder.id))
 
-        serializer = RemainderSerializer(remainder)
+        remainders = Remainder.objects.filter(id=remainder.id)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual(res.data, expected_remainders(remainders)[0])
 
     def test_create_remainder(self):
         """ Test creating a remainder works """
         payload = {
             'title': "Agatka's Birthday",
-            'remainder_date': date(self.today.year + 1, 2, 27),
+            'remainder_date': NEXT_FEB_27,
             'description': "Agatka's birthday yearly remainder.",
             'permanent': True
         }
@@ -130,8 +167,7 @@ class PrivateRecipeAPITests(TestCase):
 
     def test_deleting_someones_remainder_not_possible(self):
         """ Test deleting someone's else remainder is not possible """
-        other_user = create_user(email='other_user@example.com')
-        remainder = create_remainder(user=other_user)
+        remainder = create_remainder(user=self.other_user)
         res = self.client.delete(detail_url(remainder.id))
 
         self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
@@ -140,8 +176,8 @@ class PrivateRecipeAPITests(TestCase):
     def test_partial_update(self):
         """ Test patching a remainder """
         original_title = "Agatka's birthday"
-        payload = {'remainder_date': date(self.today.year + 1, 2, 28)}
-        remainder = create_remainder(user=self.user, title=original_title, remainder_date=date(self.today.year + 1, 2, 27))
+        payload = {'remainder_date': NEXT_FEB_28}
+        remainder = create_remainder(user=self.user, title=original_title, remainder_date=NEXT_FEB_27)
         res = self.client.patch(detail_url(remainder.id), payload)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
@@ -157,7 +193,7 @@ class PrivateRecipeAPITests(TestCase):
         remainder = create_remainder(user=self.user)
         paylaod = {
             'title': 'Updated Title',
-            'remainder_date': date(self.today.year + 1, 1, 1),
+            'remainder_date': NEXT_JAN_1,
             'description': 'Updated Description',
         }
         res = self.client.put(detail_url(remainder.id), paylaod)
@@ -171,10 +207,9 @@ class PrivateRecipeAPITests(TestCase):
 
     def test_cannot_update_user_of_remainder(self):
         """ Test cannot change the user field of the remainder """
-        new_user = create_user(email='new_user@example.com')
         remainder = create_remainder(user=self.user)
 
-        self.client.patch(detail_url(remainder.id), {'user': new_user.id})
+        self.client.patch(detail_url(remainder.id), {'user': self.other_user.id})
         remainder.refresh_from_db()
 
         # We don't assert status code since it will be 200, but serializer won't let changing user
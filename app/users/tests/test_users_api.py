@@ -1,12 +1,14 @@
 """ Tests for the users API """
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 from django.urls import reverse
 
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework import status
 
+from ..views import ManageUserView, DeleteMeView
+
 CREATE_USER_URL = reverse('users:register')
 TOKEN_URL = reverse('users:token')
 ME_URL = reverse('users:me')
@@ -68,11 +70,12 @@ class PublicUsersAPITests(TestCase):
         }
 
         for password in passwords:
-            payload.update({'password': password})
-            res = self.client.post(CREATE_USER_URL, payload)
-            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-            user_exists = get_user_model().objects.filter(email=payload['email']).exists()
-            self.assertFalse(user_exists)
+            with self.subTest(password=password):
+                payload.update({'password': password})
+                res = self.client.post(CREATE_USER_URL, payload)
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+                user_exists = get_user_model().objects.filter(email=payload['email']).exists()
+                self.assertFalse(user_exists)
 
     def test_create_token_for_user(self):
         """ Test generating token for valid credentials """
@@ -102,23 +105,37 @@ class PublicUsersAPITests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertNotIn('token', res.data)
 
+
+class UnauthenticatedUsersAPITests(SimpleTestCase):
+    """ Test the users API rejects unauthenticated requests without touching the database """
+
+    def setUp(self):
+        # Calling the view directly skips the middleware and URL resolving, only auth is under test
+        self.factory = APIRequestFactory()
+
     def test_retrieve_user_unauthorized(self):
         """ Test authentication is required for users """
-        res = self.client.get(ME_URL)
+        request = self.factory.get(ME_URL)
+        res = ManageUserView.as_view()(request)
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_delete_user_unauthorized(self):
         """ Test deleting the user is allowed only to authenticated users """
-        res = self.client.delete(DELETE_ME_URL)
+        request = self.factory.delete(DELETE_ME_URL)
+        res = DeleteMeView.as_view()(request)
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
 class PrivateUsersAPITests(TestCase):
     """ Test API requests that require authentication """
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Sprawdzić czy działa bez hasła w sumie, skoro password=None
-        self.user = create_user(email='test@example.com', password='Test1234', name='Test Name')
+        # Created once per class, every test is rolled back to this state
+        cls.user = create_user(email='test@example.com', password='Test1234', name='Test Name')
+
+    def setUp(self):
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 